@@ -1,8 +1,20 @@
 from asyncio import TimeoutError
 from enum import Enum
 from inspect import iscoroutinefunction
-from random import randint
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
+from itertools import count
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from warnings import warn
 
 from interactions.ext.wait_for import setup, wait_for_component
 
@@ -23,6 +35,15 @@ from interactions import (
 
 from .errors import PaginatorWontWork, StopPaginator
 
+_ids = count()
+
+_FIRST_EMOJI = Emoji(name="⏮️")
+_LAST_EMOJI = Emoji(name="⏭️")
+
+
+def _truncate(text: str, length: int = 96) -> str:
+    return f"{text[: length - 3]}..." if len(text) > length else text
+
 
 class ButtonKind(str, Enum):
     """
@@ -46,18 +67,20 @@ class ButtonKind(str, Enum):
 
 class DictSerializerMixin:
     __slots__ = ("_json",)
+    _slot_set: FrozenSet[str] = frozenset(__slots__)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._slot_set = frozenset(cls.__slots__)
 
     def __init__(self, **kwargs):
         self._json = kwargs
 
-        for key, value in kwargs.items():
-            if not hasattr(self, "__slots__") or key in self.__slots__:
-                setattr(self, key, value)
-
-        if hasattr(self, "__slots__"):
-            for _attr in self.__slots__:
-                if not hasattr(self, _attr):
-                    setattr(self, _attr, None)
+        for _attr in self._slot_set:
+            if _attr in kwargs:
+                setattr(self, _attr, kwargs[_attr])
+            elif not hasattr(self, _attr):
+                setattr(self, _attr, None)
 
 
 class Data(DictSerializerMixin):
@@ -108,16 +131,12 @@ class Page(DictSerializerMixin):
         if title:
             self.title = title
         elif content:
-            self.title = f"{content[:93]}..." if len(content) > 96 else content
+            self.title = _truncate(content)
         elif embeds and isinstance(embeds, Embed) and embeds.title:
-            self.title = f"{embeds.title[:93]}..." if len(embeds.title) > 96 else embeds.title
+            self.title = _truncate(embeds.title)
         elif embeds and isinstance(embeds, list) and embeds[0].title:
             self.title = next(
-                (
-                    f"{embed.title[:93]}..." if len(embed.title) > 96 else embed.title
-                    for embed in embeds
-                    if embed.title
-                ),
+                (_truncate(embed.title) for embed in embeds if embed.title),
                 "No title",
             )
         else:
@@ -161,16 +180,17 @@ class Paginator(DictSerializerMixin):
     - *async* `run() -> ?Data`: Runs the paginator in a loop until timed out.
     - *property* `custom_ids -> list[str]`: The custom IDs of the components.
     - *async* `component_logic()`: The logic for the components when clicked.
-    - *async* `check(ctx: ComponentContext) -> bool`: Whether the paginator is for the user.
-    - *func* `select_row() -> ?ActionRow`: The select action row.
-    - *func* `buttons_row() -> ?ActionRow`: The buttons action row.
+    - *func* `check(ctx: ComponentContext) -> bool | Awaitable[bool]`: Whether the paginator is for the user.
+    - *func* `index_label() -> str`: The placeholder followed by the current page number.
+    - *func* `select_row(?label: str) -> ?ActionRow`: The select action row.
+    - *func* `buttons_row(?label: str) -> ?ActionRow`: The buttons action row.
     - *func* `components() -> list[?ActionRow]`: The components as action rows.
     - *async* `send() -> Message`: Sends the paginator.
     - *async* `edit() -> Message`: Edits the paginator.
     - *func* `disabled_components() -> list[?ActionRow]`: The disabled components as action rows.
     - *func* `removed_components()`: The removed components.
     - *async* `end_paginator()`: Ends the paginator.
-    - *async* `run_function(func: Callable) -> bool`: Runs a function.
+    - *async* `run_function(func: Callable, ?is_coro: bool) -> bool`: Runs a function.
     - *func* `data() -> Data`: The data of the paginator.
     """
 
@@ -199,6 +219,16 @@ class Paginator(DictSerializerMixin):
         "is_embeds",
         "message",
         "_msg",
+        "_select_menu",
+        "_custom_ids",
+        "_dispatch",
+        "_before_is_coro",
+        "_after_is_coro",
+        "_last_components",
+        "_default_buttons",
+    )
+    _json_slots: FrozenSet[str] = frozenset(
+        name for name in __slots__ if name[0] != "_" and name not in {"component_ctx", "message"}
     )
     _json: Dict[str, Any]
     client: Client
@@ -224,6 +254,13 @@ class Paginator(DictSerializerMixin):
     is_embeds: bool
     message: Message
     _msg: Dict[str, Optional[Snowflake]]
+    _select_menu: Optional[SelectMenu]
+    _custom_ids: List[str]
+    _dispatch: Dict[str, Callable[[], None]]
+    _before_is_coro: bool
+    _after_is_coro: bool
+    _last_components: Optional[List[ActionRow]]
+    _default_buttons: Dict[str, Button]
 
     def __init__(
         self,
@@ -254,6 +291,11 @@ class Paginator(DictSerializerMixin):
             raise PaginatorWontWork("All pages must be of type `Page`!")
         if not hasattr(client, "wait_for_component"):
             setup(client)
+        if use_select and len(pages) > 25:
+            warn(
+                "Select menus are limited to 25 options, so the select menu will not be shown.",
+                stacklevel=2,
+            )
 
         super().__init__(
             client=client,
@@ -273,7 +315,31 @@ class Paginator(DictSerializerMixin):
             func_after_edit=func_after_edit,
             **kwargs,
         )
-        self.id: int = kwargs.get("id", randint(0, 999_999_999))
+        self.id: int = kwargs["id"] if "id" in kwargs else next(_ids)
+        self._custom_ids = [
+            f"select{self.id}",
+            f"first{self.id}",
+            f"prev{self.id}",
+            f"index{self.id}",
+            f"next{self.id}",
+            f"last{self.id}",
+        ]
+        self._dispatch = {
+            self._custom_ids[0]: self._on_select,
+            self._custom_ids[1]: self._on_first,
+            self._custom_ids[2]: self._on_prev,
+            self._custom_ids[4]: self._on_next,
+            self._custom_ids[5]: self._on_last,
+        }
+        self._default_buttons = {
+            "first": Button(style=1, emoji=_FIRST_EMOJI, custom_id=self._custom_ids[1]),
+            "prev": Button(style=1, label="<", custom_id=self._custom_ids[2]),
+            "index": Button(style=1, label=self.placeholder, custom_id=self._custom_ids[3]),
+            "next": Button(style=1, label=">", custom_id=self._custom_ids[4]),
+            "last": Button(style=1, emoji=_LAST_EMOJI, custom_id=self._custom_ids[5]),
+        }
+        self._before_is_coro = iscoroutinefunction(func_before_edit)
+        self._after_is_coro = iscoroutinefunction(func_after_edit)
         self.component_ctx: Optional[ComponentContext] = kwargs.get("component_ctx")
         self.index: int = kwargs.get("index", 0)
         self.top: int = kwargs.get("top", len(pages) - 1)
@@ -301,7 +367,9 @@ class Paginator(DictSerializerMixin):
             result: Optional[bool] = None
             if self.func_before_edit is not None:
                 try:
-                    result: Optional[bool] = await self.run_function()
+                    result: Optional[bool] = await self.run_function(
+                        self.func_before_edit, self._before_is_coro
+                    )
                 except StopPaginator:
                     return self.data()
                 if result is False:
@@ -314,7 +382,9 @@ class Paginator(DictSerializerMixin):
                 self.message.id = self._msg["message_id"]
             if self.func_after_edit is not None:
                 try:
-                    result: Optional[bool] = await self.run_function()
+                    result: Optional[bool] = await self.run_function(
+                        self.func_after_edit, self._after_is_coro
+                    )
                 except StopPaginator:
                     return self.data()
                 if result is False:
@@ -322,100 +392,108 @@ class Paginator(DictSerializerMixin):
 
     @property
     def custom_ids(self) -> List[str]:
-        return [
-            f"select{self.id}",
-            f"first{self.id}",
-            f"prev{self.id}",
-            f"index{self.id}",
-            f"next{self.id}",
-            f"last{self.id}",
-        ]
+        return self._custom_ids
 
     async def component_logic(self) -> None:
-        custom_id: str = self.component_ctx.data.custom_id
-        if custom_id == f"select{self.id}":
-            self.index = int(self.component_ctx.data.values[0]) - 1
-        elif custom_id == f"first{self.id}":
-            self.index = 0
-        elif custom_id == f"prev{self.id}":
-            self.index -= 1
-            self.index = max(self.index, 0)
-        elif custom_id == f"next{self.id}":
-            self.index += 1
-            self.index = min(self.index, self.top)
-        elif custom_id == f"last{self.id}":
-            self.index = self.top
-
-    async def check(self, ctx: ComponentContext) -> bool:
-        boolean: bool = True
-        if self.author_only:
-            boolean = ctx.user.id == self.ctx.user.id
-        if not boolean:
-            await ctx.send("This paginator is not for you!", ephemeral=True)
-        return boolean
-
-    def select_row(self) -> Optional[ActionRow]:
+        handler: Optional[Callable[[], None]] = self._dispatch.get(
+            self.component_ctx.data.custom_id
+        )
+        if handler is not None:
+            handler()
+
+    def _on_select(self) -> None:
+        self.index = int(self.component_ctx.data.values[0]) - 1
+
+    def _on_first(self) -> None:
+        self.index = 0
+
+    def _on_prev(self) -> None:
+        self.index = max(self.index - 1, 0)
+
+    def _on_next(self) -> None:
+        self.index = min(self.index + 1, self.top)
+
+    def _on_last(self) -> None:
+        self.index = self.top
+
+    def check(self, ctx: ComponentContext) -> Union[bool, Awaitable[bool]]:
+        if not self.author_only or ctx.user.id == self.ctx.user.id:
+            return True
+        return self._reject(ctx)
+
+    async def _reject(self, ctx: ComponentContext) -> bool:
+        await ctx.send("This paginator is not for you!", ephemeral=True)
+        return False
+
+    def select_row(self, label: Optional[str] = None) -> Optional[ActionRow]:
         if not self.use_select or len(self.pages) > 25:
             return
 
-        select_options = [
-            SelectOption(label=f"{page_num}: {page.title}", value=page_num)
-            for page_num, page in enumerate(self.pages, start=1)
-        ]
-
-        select = SelectMenu(
-            options=select_options,
-            custom_id=f"select{self.id}",
-            placeholder=f"{self.placeholder} {self.index + 1}/{self.top + 1}",
-            min_values=1,
-            max_values=1,
-        )
-        return ActionRow(components=[select])
+        if label is None:
+            label = self.index_label()
+        if self._select_menu is None:
+            self._select_menu = SelectMenu(
+                options=[
+                    SelectOption(label=f"{page_num}: {page.title}", value=page_num)
+                    for page_num, page in enumerate(self.pages, start=1)
+                ],
+                custom_id=f"select{self.id}",
+                placeholder=label,
+                min_values=1,
+                max_values=1,
+            )
+        else:
+            self._select_menu.placeholder = label
+        return ActionRow(components=[self._select_menu])
 
-    def buttons_row(self) -> Optional[ActionRow]:
+    def buttons_row(self, label: Optional[str] = None) -> Optional[ActionRow]:
         if not self.use_buttons:
             return
 
-        disabled_left = self.index == 0
-        disabled_right = self.index == self.top
-        buttons = [
-            self.buttons.get("first", Button(style=1, emoji=Emoji(name="⏮️")))
-            if self.extended_buttons
-            else None,
-            self.buttons.get("prev", Button(style=1, label="<")),
-            self.buttons.get(
-                "index",
-                Button(style=1, label=f"{self.placeholder} {self.index + 1}/{self.top + 1}"),
+        custom_ids: List[str] = self._custom_ids
+        defaults: Dict[str, Button] = self._default_buttons
+        disabled_left: bool = self.index == 0
+        disabled_right: bool = self.index == self.top
+        buttons: List[Tuple[Button, str, bool]] = []
+        if self.extended_buttons:
+            buttons.append(
+                (self.buttons.get("first") or defaults["first"], custom_ids[1], disabled_left)
             )
-            if self.use_index
-            else None,
-            self.buttons.get("next", Button(style=1, label=">")),
-            self.buttons.get("last", Button(style=1, emoji=Emoji(name="⏭️")))
-            if self.extended_buttons
-            else None,
-        ]
-
-        for i, button in enumerate(buttons):
-            if button is None:
-                continue
-            button.custom_id = self.custom_ids[i + 1]
-            button._json.update({"custom_id": button.custom_id})
-            button.disabled = (
-                disabled_left
-                if button.custom_id in self.custom_ids[1:3]
-                else True
-                if button.custom_id == self.custom_ids[3]
-                else disabled_right
+        buttons.append((self.buttons.get("prev") or defaults["prev"], custom_ids[2], disabled_left))
+        if self.use_index:
+            if label is None:
+                label = self.index_label()
+            index_button: Button = self.buttons.get("index") or defaults["index"]
+            index_button.label = label
+            buttons.append((index_button, custom_ids[3], True))
+        buttons.append(
+            (self.buttons.get("next") or defaults["next"], custom_ids[4], disabled_right)
+        )
+        if self.extended_buttons:
+            buttons.append(
+                (self.buttons.get("last") or defaults["last"], custom_ids[5], disabled_right)
             )
-            button._json.update({"disabled": button.disabled})
-            if button.custom_id == self.custom_ids[3]:
-                button.label = f"{self.placeholder} {self.index + 1}/{self.top + 1}"
-                button._json.update({"label": button.label})
 
-        return ActionRow(components=list(filter(None, buttons)))
+        for button, custom_id, disabled in buttons:
+            button.custom_id = custom_id
+            button.disabled = disabled
+
+        return ActionRow(components=[button for button, _, _ in buttons])
+
+    def index_label(self) -> str:
+        return f"{self.placeholder} {self.index + 1}/{self.top + 1}"
 
     def components(self) -> List[ActionRow]:
-        return list(filter(None, [self.select_row(), self.buttons_row()]))
+        label: str = self.index_label()
+        components: List[ActionRow] = []
+        select_row: Optional[ActionRow] = self.select_row(label)
+        if select_row is not None:
+            components.append(select_row)
+        buttons_row: Optional[ActionRow] = self.buttons_row(label)
+        if buttons_row is not None:
+            components.append(buttons_row)
+        self._last_components = components
+        return components
 
     async def send(self) -> Message:
         return await self.ctx.send(components=self.components(), **self.pages[self.index]._json, ephemeral=True)
@@ -426,7 +504,7 @@ class Paginator(DictSerializerMixin):
         )
 
     def disabled_components(self) -> List[ActionRow]:
-        components = self.components()
+        components = self._last_components or self.components()
         for action_row in components:
             for component in action_row.components:
                 component.disabled = True
@@ -444,9 +522,11 @@ class Paginator(DictSerializerMixin):
             else MISSING
         )
 
-    async def run_function(self, func) -> bool:
+    async def run_function(self, func, is_coro: Optional[bool] = None) -> bool:
         if func is not None:
-            if iscoroutinefunction(func):
+            if is_coro is None:
+                is_coro = iscoroutinefunction(func)
+            if is_coro:
                 return await func(self, self.component_ctx)
             else:
                 return func(self, self.component_ctx)
@@ -465,8 +545,8 @@ class Paginator(DictSerializerMixin):
     __str__ = __repr__
 
     def __setattr__(self, __name: str, __value: Any) -> None:
-        if __name == "_json":
-            object.__setattr__(self, "_json", __value)
-        elif __name in self.__slots__:
-            self._json.update({__name: __value})
+        if __name in self._json_slots:
+            self._json[__name] = __value
+            if __name == "pages":
+                super().__setattr__("_select_menu", None)
         return super().__setattr__(__name, __value)